@@ -2,18 +2,36 @@
 # -*- coding: utf-8 -*-
 
 import glob
+import io
 import re
-from collections import OrderedDict
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import update_wrapper
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import dask.array as da
 import numpy as np
 import pandas as pd
 import xarray as xr
+from dask import delayed
+from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
-from tifffile import TiffFile, TiffFileError, TiffSequence, imread
-from tifffile.tifffile import TiffTags
+from tifffile import TiffFile, TiffFileError, imread, memmap
 
 from .. import constants, exceptions, types
 from ..dimensions import (
@@ -29,6 +47,109 @@ from .reader import Reader
 
 TIFF_IMAGE_DESCRIPTION_TAG_INDEX = 270
 
+# Number of leading bytes fetched from each remote file when batch reading tags,
+# enough to hold the header and first IFD of most tiffs
+TIFF_HEADER_PREFETCH_BYTES = 16384
+
+_ArrayT = TypeVar("_ArrayT", np.ndarray, da.Array)
+
+_DIGIT_RE = re.compile(r"(\d+)")
+
+
+def _extract_indices(file_series: pd.Series, dims: Sequence[str]) -> pd.DataFrame:
+    """
+    Parse the numbers out of every filename in a single vectorized pass and assign
+    them, in order, to the provided dims.
+
+    Parameters
+    ----------
+    file_series: pd.Series
+        The paths to parse. Only the file name (not the parent directories) is used.
+    dims: Sequence[str]
+        The dimension names to assign to each found number.
+
+    Returns
+    -------
+    indices: pd.DataFrame
+        A DataFrame with the same index as file_series and one integer column per dim.
+
+    Raises
+    ------
+    ValueError
+        A filename did not contain exactly one number per dim.
+    """
+    names = file_series.map(lambda p: Path(p).name).astype(str)
+    matches = names.str.extractall(_DIGIT_RE)[0].unstack()
+
+    # Filenames without any numbers are dropped by extractall, filenames with
+    # fewer numbers than others are padded with nans.
+    if (
+        len(matches) != len(file_series)
+        or matches.shape[1] != len(dims)
+        or matches.isnull().values.any()
+    ):
+        raise ValueError(
+            f"Expected {len(dims)} numbers in each filename to use as the "
+            f"{list(dims)} indices."
+        )
+
+    matches.columns = list(dims)
+    return matches.reindex(file_series.index).astype(np.int64)
+
+
+class VectorizedIndexer:
+    """
+    Decorator marking a TiffGlobReader indexer that consumes the pd.Series of all
+    filenames in a single call rather than each filename individually.
+
+    Parameters
+    ----------
+    func: Callable[[pd.Series], pd.DataFrame]
+        Function that returns a pd.DataFrame with one row per filename, in the
+        same order, and one column per dimension.
+    """
+
+    def __init__(self, func: Callable[[pd.Series], pd.DataFrame]):
+        self.func = func
+        update_wrapper(self, func)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.func(*args, **kwargs)
+
+
+class _TiffRegion:
+    """Array-like that reads only the strips or tiles covering the indexed region."""
+
+    def __init__(
+        self, fs: AbstractFileSystem, path: str, shape: Tuple[int, ...], dtype: np.dtype
+    ):
+        self.fs = fs
+        self.path = path
+        self.shape = shape
+        self.dtype = dtype
+        self.ndim = len(shape)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        with self.fs.open(self.path) as open_resource:
+            with imread(open_resource, aszarr=True, series=0, level=0) as store:
+                # Read with the synchronous scheduler so that the read of a single
+                # chunk doesn't look for or hand off to another scheduler
+                return da.from_zarr(store)[key].compute(scheduler="synchronous")
+
+
+class _SceneLayout(NamedTuple):
+    """Grouping of the files and array sizes of a single scene."""
+
+    first_filename: str
+    group_files: List[np.ndarray]
+    group_sizes: Dict[str, int]
+    chunk_sizes: Dict[str, int]
+    unpack_sizes: Dict[str, int]
+    reshape_sizes: Tuple[int, ...]
+    axes_order: Tuple[int, ...]
+    expanded_blocks_sizes: Dict[str, int]
+    expanded_chunk_sizes: Dict[str, int]
+
 
 class TiffGlobReader(Reader):
     r"""
@@ -44,6 +165,9 @@ class TiffGlobReader(Reader):
         If callable, should consume each filename and return a pd.Series with series
         index corresponding to the dimensions and values corresponding to the array
         index of that image file within the larger array.
+        If the callable is decorated with VectorizedIndexer it is instead called
+        once with the pd.Series of all filenames and should return a pd.DataFrame
+        with one row per file and one column per dimension.
         Default: None (Look for 4 numbers in the file name and use them as
         S, T, C, and Z indices.)
     scene_glob_character: str
@@ -75,6 +199,28 @@ class TiffGlobReader(Reader):
     fs_kwargs: Dict[str, Any]
         Any specific keyword arguments to pass down to the fsspec created filesystem.
         Default: {}
+    maxworkers: Optional[int]
+        Maximum number of threads used to read files in parallel.
+        When reading a scene into memory None reads its files with five threads
+        per CPU (tifffile's ioworkers=None). The delayed array is already computed
+        in parallel by dask, so None reads the files of each chunk one at a time.
+        Default: None
+    chunks: Optional[
+        Union[int, str, Tuple, Dict[Union[int, str], Union[int, str]]]
+    ]
+        Chunks to rechunk the delayed array of each scene to, in any form accepted
+        by dask.array.rechunk with axes in the dimension order of the reader
+        (i.e. {0: "auto", 1: -1, 2: -1}). Dict keys may also be dimension names
+        (i.e. {"T": "auto", "Y": -1, "X": -1}). "auto" or a byte size such as
+        "128MiB" let dask pick chunks near that size (the "array.chunk-size" dask
+        config value for "auto").
+        Note: these chunks are applied after each group of files defined by
+        chunk_dims has been read whole, so they do not reduce the memory needed
+        to compute a chunk. Use chunk_dims to read fewer files per chunk.
+        The exception is "native", which reads each file in chunks of the strips
+        or tiles it is stored in, so that reading a region only reads and decodes
+        the strips or tiles it covers.
+        Default: None (one chunk per group of files as defined by chunk_dims)
 
     Examples
     --------
@@ -109,6 +255,19 @@ class TiffGlobReader(Reader):
         return series
 
     mm_reader = TiffGlobReader(files, indexer=mm_indexer)
+
+    # an indexer can also parse all of the filenames at once, which is much faster
+    # for large sets of files
+
+    from aicsimageio.readers.tiff_glob_reader import VectorizedIndexer
+    @VectorizedIndexer
+    def mm_vectorized_indexer(paths):
+        names = paths.map(lambda p: Path(p).name)
+        inds = names.str.extractall(r"(\d+)")[0].unstack()
+        inds.columns = ['C', 'S', 'T', 'Z']
+        return inds.astype(int)
+
+    mm_reader = TiffGlobReader(files, indexer=mm_vectorized_indexer)
     """
 
     @staticmethod
@@ -137,6 +296,10 @@ class TiffGlobReader(Reader):
             DimensionNames.SpatialX,
         ),
         fs_kwargs: Dict[str, Any] = {},
+        maxworkers: Optional[int] = None,
+        chunks: Optional[
+            Union[int, str, Tuple, Dict[Union[int, str], Union[int, str]]]
+        ] = None,
         **kwargs: Any,
     ):
 
@@ -157,6 +320,8 @@ class TiffGlobReader(Reader):
             raise ValueError("No files found matching glob pattern")
 
         self.scene_glob_character = scene_glob_character
+        self._maxworkers = maxworkers
+        self._chunks = chunks
 
         if indexer is None:
             series_idx = [
@@ -168,14 +333,14 @@ class TiffGlobReader(Reader):
 
             # By default we will attempt to parse 4 numbers out of the filename
             # and assign them in order to be the corresponding S, T, C, and Z indices.
-            # So indexer("path/to/data/S0_T1_C2_Z3.tif") returns
+            # So "path/to/data/S0_T1_C2_Z3.tif" is indexed as
             # pd.Series([0,1,2,3], index=['S','T','C', 'Z'])
-            def indexer(x: str) -> pd.Series:
-                return pd.Series(
-                    re.findall(r"\d+", Path(x).name), index=series_idx
-                ).astype(int)
-
-        if callable(indexer):
+            self._all_files = _extract_indices(file_series, series_idx)
+            self._all_files["filename"] = file_series
+        elif isinstance(indexer, VectorizedIndexer):
+            self._all_files = indexer(file_series).reset_index(drop=True)
+            self._all_files["filename"] = file_series
+        elif callable(indexer):
             self._all_files = file_series.apply(indexer)
             self._all_files["filename"] = file_series
         elif isinstance(indexer, pd.DataFrame):
@@ -198,6 +363,21 @@ class TiffGlobReader(Reader):
 
         self._all_files = self._all_files.sort_values(sort_order).reset_index(drop=True)
 
+        # Keep a columnar copy of the indices so that per scene selection and grouping
+        # can be done with plain numpy operations
+        self._filenames = self._all_files.filename.to_numpy()
+        self._idx_cols: Dict[str, np.ndarray] = {
+            d: self._all_files[d].to_numpy()
+            for d in self._all_files.columns
+            if d != "filename"
+        }
+
+        # The set of files is fixed so the scenes can be determined once
+        self._scenes: Tuple[str, ...] = tuple(
+            metadata_utils.generate_ome_image_id(s)
+            for s in range(np.unique(self._idx_cols[self.scene_glob_character]).size)
+        )
+
         # run tests on a single file (?)
         self._fs, self._path = io_utils.pathlike_to_fs(
             self._all_files.iloc[0].filename,
@@ -244,6 +424,7 @@ class TiffGlobReader(Reader):
 
         # Safety measure / "feature"
         self.chunk_dims = [d.upper() for d in self.chunk_dims]
+        self._chunk_dim_set = frozenset(self.chunk_dims)
 
         if dim_order is not None:
             self._dim_order = dim_order
@@ -254,10 +435,50 @@ class TiffGlobReader(Reader):
                 if d in self._all_files.columns or d in self.chunk_dims
             )
 
+        # Translate any dimension names used as chunks keys to axes
+        if isinstance(chunks, dict):
+            dim_order_dims = list(self._dim_order)
+            unknown_dims = [
+                k for k in chunks if isinstance(k, str) and k not in dim_order_dims
+            ]
+            if len(unknown_dims) > 0:
+                raise ValueError(
+                    f"chunks contains dimensions that are not in the dimension "
+                    f"order. Unknown dimensions: {unknown_dims}, "
+                    f"Dimension order: {self._dim_order}"
+                )
+            self._chunks = {
+                dim_order_dims.index(k) if isinstance(k, str) else k: v
+                for k, v in chunks.items()
+            }
+
+        # Parse the first file a single time, this both enforces a valid image and
+        # provides the metadata reused by every read
+        try:
+            with self._open_tiff(self._path) as tiff:
+                series = tiff.series[0]
+                self._probe_series_shape = series.shape
+                self._probe_dtype = series.dtype
+
+                # Older tifffile versions name the offset of contiguous data "offset"
+                if hasattr(series, "dataoffset"):
+                    probe_is_contiguous = series.dataoffset is not None
+                else:
+                    probe_is_contiguous = series.offset is not None
+                self._probe_tags = self._get_tiff_tags(tiff)
+                probe_native_chunks = self._get_native_chunks(tiff)
+        except (TiffFileError, TypeError):
+            raise exceptions.UnsupportedFileFormatError(
+                self.__class__.__name__, self._path
+            )
+
+        # Tags of the first file of each scene, keyed by filename
+        self._scene_tiff_tags: Dict[str, Dict[int, Any]] = {
+            str(self._filenames[0]): self._probe_tags
+        }
+
         if single_file_shape is None:
-            with self._fs.open(self._path) as open_resource:
-                with TiffFile(open_resource) as tiff:
-                    self._single_file_shape = tiff.series[0].shape
+            self._single_file_shape = self._probe_series_shape
 
         else:
             self._single_file_shape = single_file_shape
@@ -276,100 +497,270 @@ class TiffGlobReader(Reader):
         self._single_file_sizes = dict(
             zip(self._single_file_dims, self._single_file_shape)
         )
-        # Enforce valid image
-        if not self._is_supported_image(self._fs, self._path):
-            raise exceptions.UnsupportedFileFormatError(
-                self.__class__.__name__, self._path
-            )
+        self._single_file_dim_index = {
+            d: i for i, d in enumerate(self._single_file_dims)
+        }
+
+        # Uncompressed local files can be memory mapped instead of decoded
+        self._use_memmap = isinstance(self._fs, LocalFileSystem) and (
+            probe_is_contiguous
+            and tuple(self._single_file_shape) == tuple(self._probe_series_shape)
+        )
 
-    @property
-    def scenes(self) -> Tuple[str, ...]:
-        if self._scenes is None:
-            self._scenes = tuple(
-                metadata_utils.generate_ome_image_id(s)
-                for s in range(self._all_files[self.scene_glob_character].nunique())
-            )
-        return self._scenes
+        # The on disk layout only describes the files if they match the probe
+        if tuple(self._single_file_shape) == tuple(self._probe_series_shape):
+            self._native_chunks: Optional[Tuple[int, ...]] = probe_native_chunks
+        else:
+            self._native_chunks = None
 
-    def _read_delayed(self) -> xr.DataArray:
+        # Layout of each scene keyed by (scene index, grouped), filled on first read
+        self._scene_layouts: Dict[Tuple[int, bool], _SceneLayout] = {}
 
-        scene_files = self._all_files.loc[
-            self._all_files[self.scene_glob_character] == self.current_scene_index
-        ]
-        scene_files = scene_files.drop(self.scene_glob_character, axis=1)
-        scene_nunique = scene_files.nunique()
+    @contextmanager
+    def _open_tiff(self, path: types.PathLike) -> Iterator[TiffFile]:
+        # Local files can skip the fsspec file object entirely
+        if isinstance(self._fs, LocalFileSystem):
+            with TiffFile(path) as tiff:
+                yield tiff
 
-        tiff_tags = self._get_tiff_tags(TiffFile(scene_files.filename.iloc[0]))
+        else:
+            with self._fs.open(path) as open_resource:
+                with TiffFile(open_resource) as tiff:
+                    yield tiff
 
-        group_dims = [
-            x for x in scene_files.columns if x not in ["filename", *self.chunk_dims]
+    def _read_tiff_tags(self, filename: str) -> Dict[int, Any]:
+        with self._open_tiff(filename) as tiff:
+            return self._get_tiff_tags(tiff)
+
+    def _prefetch_scene_tiff_tags(self) -> None:
+        _, first_file_idxs = np.unique(
+            self._idx_cols[self.scene_glob_character], return_index=True
+        )
+        filenames = [
+            str(f)
+            for f in self._filenames[first_file_idxs]
+            if str(f) not in self._scene_tiff_tags
         ]
+        if len(filenames) == 0:
+            return
+
+        # Fetch the start of every file in one batch of concurrent requests
+        buffers = self._fs.cat_ranges(
+            filenames,
+            [0] * len(filenames),
+            [TIFF_HEADER_PREFETCH_BYTES] * len(filenames),
+            on_error="return",
+        )
+        for filename, buffer in zip(filenames, buffers):
+            # Files whose request failed or whose tags did not fit in the
+            # prefetched bytes are read in full when their scene is read
+            if isinstance(buffer, bytes):
+                tags = self._parse_tiff_tags(buffer)
+                if tags is not None:
+                    self._scene_tiff_tags[filename] = tags
+
+    @staticmethod
+    def _parse_tiff_tags(buffer: bytes) -> Optional[Dict[int, Any]]:
+        try:
+            with TiffFile(io.BytesIO(buffer)) as tiff:
+                page = tiff.series[0].pages[0]
+                n_parsed_tags = len(page.tags)
+                tags = TiffGlobReader._get_tiff_tags(tiff)
+
+                # tifffile drops tags whose value lies past the end of the buffer,
+                # so compare against the number of tags stored in the IFD
+                tagno_format = tiff.byteorder + ("Q" if tiff.is_bigtiff else "H")
+                (n_ifd_tags,) = struct.unpack_from(tagno_format, buffer, page.offset)
+
+        except (TiffFileError, IndexError, struct.error):
+            return None
+
+        if n_parsed_tags != n_ifd_tags:
+            return None
+
+        return tags
+
+    def _get_scene_tiff_tags(self, filename: str) -> Dict[int, Any]:
+        # The first read of another scene on a remote filesystem fetches the tags
+        # of all scenes at once
+        if filename not in self._scene_tiff_tags and getattr(
+            self._fs, "async_impl", False
+        ):
+            self._prefetch_scene_tiff_tags()
+
+        if filename not in self._scene_tiff_tags:
+            self._scene_tiff_tags[filename] = self._read_tiff_tags(filename)
+
+        return self._scene_tiff_tags[filename]
+
+    @property
+    def scenes(self) -> Tuple[str, ...]:
+        return self._scenes
+
+    def _get_scene_indices(
+        self,
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray, Dict[str, int]]:
+        scene_mask = np.equal(
+            self._idx_cols[self.scene_glob_character], self.current_scene_index
+        )
+        scene_cols = {
+            d: col[scene_mask]
+            for d, col in self._idx_cols.items()
+            if d != self.scene_glob_character
+        }
+        scene_nunique = {d: np.unique(col).size for d, col in scene_cols.items()}
+
+        return scene_cols, self._filenames[scene_mask], scene_nunique
+
+    def _get_scene_layout(self, grouped: bool = True) -> _SceneLayout:
+        # The indices never change after init so the layout of each scene only
+        # needs to be computed once
+        cache_key = (self.current_scene_index, grouped)
+        if cache_key in self._scene_layouts:
+            return self._scene_layouts[cache_key]
+
+        scene_cols, scene_filenames, scene_nunique = self._get_scene_indices()
+
+        if grouped:
+            group_dims = [x for x in scene_cols if x not in self._chunk_dim_set]
+        else:
+            group_dims = []
 
         # xxx_sizes are modeled after xr.DataArray.sizes
-        # These are OrderedDicts that map a dimension name to a shape.
+        # These are dicts that map a dimension name to a shape.
         # Use these to align and reshape the arrays that come from imread
         # dims and sizes are not always necessary but they keep things much
         # clearer internally.
 
         # sizes of dimensions we grouping by i.e. not chunks
-        group_sizes = OrderedDict([(d, scene_nunique[d]) for d in group_dims])
+        group_sizes = {d: scene_nunique[d] for d in group_dims}
 
         # sizes of each chunk
         chunk_sizes = self._get_chunk_sizes(scene_nunique, group_dims)
 
         # sizes that will be used to reshape the array representing
         # the full glob into separate dimensions.
-        unpack_sizes = OrderedDict(
-            [
-                (d, s)
-                for d, s in scene_nunique.items()
-                if d in chunk_sizes.keys() - group_sizes.keys()
-            ]
-        )
+        unpack_dim_set = chunk_sizes.keys() - group_sizes.keys()
+        unpack_sizes = {d: s for d, s in scene_nunique.items() if d in unpack_dim_set}
         reshape_sizes = tuple(unpack_sizes.values()) + tuple(
             self._single_file_sizes.values()
         )
 
         # after unpacking the result of imread we sometimes need to rearrange dims
         # in case they are in the glob and single files.
-        axes_order = self._get_axes_order(chunk_sizes, unpack_sizes, group_sizes)
+        axes_order = self._get_axes_order(chunk_sizes, unpack_sizes)
 
         # expand the sizes with singleton dimensions to facilitate da.block at the end
         expanded_blocks_sizes, expanded_chunk_sizes = self._get_expanded_shapes(
             group_sizes, chunk_sizes
         )
 
-        # Assemble the dask array
-        if len(group_dims) > 0:  # use groupby to assemble array out of chunks
-            blocks = np.zeros(tuple(group_sizes.values()), dtype="object")
-            for i, (idx, val) in enumerate(scene_files.groupby(group_dims)):
-                with TiffSequence(val.filename.tolist()) as tif:
-                    with tif.aszarr() as zarr_im:
-                        darr = da.from_zarr(zarr_im).rechunk(-1)
+        # Number each file by its position in the grid of group then unpack dims,
+        # sorting by that number orders the files by group and then by their
+        # position within the group so each group is a contiguous run of files
+        sort_dims = [*group_dims, *unpack_sizes]
+        if len(sort_dims) > 0:
+            file_keys = np.ravel_multi_index(
+                [np.unique(scene_cols[d], return_inverse=True)[1] for d in sort_dims],
+                dims=tuple(scene_nunique[d] for d in sort_dims),
+            )
+        else:
+            file_keys = np.zeros(len(scene_filenames), dtype=np.intp)
+
+        file_order = np.argsort(file_keys, kind="stable")
+        group_ids = file_keys[file_order] // int(np.prod(list(unpack_sizes.values())))
+        group_counts = np.bincount(
+            group_ids, minlength=int(np.prod(list(group_sizes.values())))
+        )
+        # Every group must hold exactly one file per position within the group
+        if np.any(group_counts != int(np.prod(list(unpack_sizes.values())))):
+            raise ValueError(
+                f"Scene {self.current_scene_index} does not contain exactly one "
+                f"file for every combination of the {sort_dims} indices."
+            )
 
-                # unpack the first dimension if it contains multiple axes
-                darr = darr.reshape(reshape_sizes)
+        group_files = np.split(
+            scene_filenames[file_order], np.cumsum(group_counts)[:-1]
+        )
 
-                # Then reorder dimensions so matching ones from the glob
-                # and the file are adjacent (glob then file)
-                darr = darr.transpose(axes_order)
+        layout = _SceneLayout(
+            first_filename=str(scene_filenames[0]),
+            group_files=group_files,
+            group_sizes=group_sizes,
+            chunk_sizes=chunk_sizes,
+            unpack_sizes=unpack_sizes,
+            reshape_sizes=reshape_sizes,
+            axes_order=axes_order,
+            expanded_blocks_sizes=expanded_blocks_sizes,
+            expanded_chunk_sizes=expanded_chunk_sizes,
+        )
+        self._scene_layouts[cache_key] = layout
 
-                # Then reshape the array to chunk_sizes
-                darr = darr.reshape(tuple(expanded_chunk_sizes.values()))
+        return layout
 
-                blocks[idx] = darr
+    def _read_delayed(self) -> xr.DataArray:
+        layout = self._get_scene_layout()
+        reshape_sizes = layout.reshape_sizes
+        axes_order = layout.axes_order
+        expanded_blocks_sizes = layout.expanded_blocks_sizes
+        expanded_chunk_sizes = layout.expanded_chunk_sizes
+
+        tiff_tags = self._get_scene_tiff_tags(layout.first_filename)
+
+        # The blocks are arranged straight into the requested dimension order so
+        # the assembled array does not need to be transposed afterwards
+        expanded_dims = list(expanded_chunk_sizes.keys())
+        dims = list(self._dim_order)
+        if sorted(dims) != sorted(expanded_dims):
+            raise ValueError(
+                f"Dimension order does not match the dimensions of the scene. "
+                f"Dimension order: {self._dim_order}, "
+                f"Scene dims: {expanded_dims}"
+            )
+        dims_axes = tuple(expanded_dims.index(d) for d in dims)
+        chunk_shape = tuple(expanded_chunk_sizes.values())
+        final_chunk_shape = tuple(chunk_shape[i] for i in dims_axes)
+        read_native_chunks = (
+            self._chunks == "native" and self._native_chunks is not None
+        )
 
-            blocks = blocks.reshape(tuple(expanded_blocks_sizes.values()))
-            d_data = da.block(blocks.tolist())
-            dims = list(expanded_blocks_sizes.keys())
+        def load_group(files: np.ndarray) -> da.Array:
+            if read_native_chunks:
+                return self._load_native_chunks(
+                    files.tolist(), reshape_sizes, axes_order, chunk_shape, dims_axes
+                )
+
+            # The shape and dtype of every group are known up front so the files
+            # are only opened when computed, and each group is a single task
+            return da.from_delayed(
+                delayed(TiffGlobReader._load_and_arrange)(
+                    files.tolist(),
+                    self._use_memmap,
+                    reshape_sizes,
+                    axes_order,
+                    chunk_shape,
+                    dims_axes,
+                    # dask already computes the groups in parallel
+                    self._maxworkers or 1,
+                ),
+                shape=final_chunk_shape,
+                dtype=self._probe_dtype,
+            )
+
+        # Assemble the dask array
+        if len(layout.group_files) == 1:  # a single group is the whole array
+            d_data = load_group(layout.group_files[0])
 
-        else:  # assemble array in a single chunk
-            zarr_im = imread(scene_files.filename.tolist(), aszarr=True, level=0)
-            darr = da.from_zarr(zarr_im).rechunk(-1)
-            darr = darr.reshape(reshape_sizes)
-            darr = darr.transpose(axes_order)
-            d_data = darr.reshape(tuple(chunk_sizes.values()))
-            dims = list(expanded_chunk_sizes.keys())
+        else:  # assemble array out of the chunks of each group
+            darrs = [load_group(files) for files in layout.group_files]
+
+            # Group ids are the raveled positions of the groups in the block grid
+            blocks = np.empty(len(darrs), dtype=object)
+            for group_id, darr in enumerate(darrs):
+                blocks[group_id] = darr
+
+            blocks = blocks.reshape(tuple(expanded_blocks_sizes.values()))
+            d_data = da.block(blocks.transpose(dims_axes).tolist())
 
         # Assign dims and coords to construct xarray
         channel_names = self._get_channel_names_for_scene(dims, d_data.shape)
@@ -391,41 +782,35 @@ class TiffGlobReader(Reader):
 
         x_data = xr.DataArray(d_data, dims=dims, coords=coords, attrs=attrs)
 
-        x_data = x_data.transpose(*self._dim_order)
+        if self._chunks is not None and self._chunks != "native":
+            x_data.data = x_data.data.rechunk(self._chunks)
 
         return x_data
 
     def _read_immediate(self) -> xr.DataArray:
         # Set up scene specific information
-        scene_files = self._all_files.loc[
-            self._all_files[self.scene_glob_character] == self.current_scene_index
-        ]
-        scene_files = scene_files.drop(self.scene_glob_character, axis=1)
-        scene_nunique = scene_files.nunique()
-
-        tiff_tags = self._get_tiff_tags(TiffFile(scene_files.filename.iloc[0]))
+        layout = self._get_scene_layout(grouped=False)
 
-        chunk_sizes = self._get_chunk_sizes(scene_nunique)
+        tiff_tags = self._get_scene_tiff_tags(layout.first_filename)
 
-        unpack_sizes = OrderedDict(
-            [(d, s) for d, s in scene_nunique.items() if d in chunk_sizes.keys()]
-        )
-
-        reshape_sizes = tuple(unpack_sizes.values()) + tuple(
-            self._single_file_sizes.values()
-        )
-
-        axes_order = self._get_axes_order(chunk_sizes, unpack_sizes)
         # Assemble array
-        arr = imread(scene_files.filename.tolist(), level=0)
-        arr = arr.reshape(reshape_sizes)
-        arr = arr.transpose(axes_order)
-        arr = arr.reshape(tuple(chunk_sizes.values()))
+        files = layout.group_files[0].tolist()
+        shape = tuple(layout.chunk_sizes.values())
+        if layout.axes_order == tuple(range(len(layout.axes_order))):
+            # The files are stored in the same order as the final array so they
+            # can be read straight into it without any intermediate copy
+            arr = np.empty(shape, dtype=self._probe_dtype)
+            self._imread(files, self._maxworkers, out=arr)
+        else:
+            arr = self._arrange_axes(
+                self._imread(files, self._maxworkers),
+                layout.reshape_sizes,
+                layout.axes_order,
+                shape,
+            )
 
         # Assign dims and coords to construct xarray
-        dims = scene_files.columns.drop("filename").values.tolist()
-        file_dims = [x for x in self._single_file_dims if x not in dims]
-        dims += file_dims
+        dims = list(layout.chunk_sizes.keys())
 
         channel_names = self._get_channel_names_for_scene(dims, arr.shape)
 
@@ -450,81 +835,210 @@ class TiffGlobReader(Reader):
             attrs=attrs,
         )
 
+        # Match the dimension order of the delayed read
+        x_data = x_data.transpose(*self._dim_order)
+
         return x_data
 
+    def _load_native_chunks(
+        self,
+        files: List[str],
+        reshape_sizes: Tuple[int, ...],
+        axes_order: Tuple[int, ...],
+        shape: Tuple[int, ...],
+        dims_axes: Tuple[int, ...],
+    ) -> da.Array:
+        # Each chunk of each file only reads the strips or tiles it covers
+        darr = da.stack(
+            [
+                da.from_array(
+                    _TiffRegion(
+                        self._fs, f, tuple(self._single_file_shape), self._probe_dtype
+                    ),
+                    chunks=self._native_chunks,
+                    meta=np.empty(
+                        (0,) * len(self._single_file_shape), self._probe_dtype
+                    ),
+                )
+                for f in files
+            ]
+        )
+        darr = self._arrange_axes(darr, reshape_sizes, axes_order, shape)
+
+        # Then move the dimensions into the reader dimension order
+        if dims_axes != tuple(range(len(dims_axes))):
+            darr = darr.transpose(dims_axes)
+
+        return darr
+
+    @staticmethod
+    def _imread(files: List[str], ioworkers: Optional[int], **kwargs: Any) -> Any:
+        # Older tifffile versions only accept ioworkers when reading a sequence
+        if len(files) > 1:
+            kwargs["ioworkers"] = ioworkers
+
+        return imread(files, level=0, **kwargs)
+
+    @staticmethod
+    def _read_files(files: List[str], use_memmap: bool, ioworkers: int) -> np.ndarray:
+        if not use_memmap:
+            return TiffGlobReader._imread(files, ioworkers)
+
+        def read_file(f: str) -> np.ndarray:
+            try:
+                return memmap(f, mode="r")
+
+            # The image data of this file is not stored contiguously
+            except ValueError:
+                return imread(f, level=0)
+
+        # Memory mapping skips decoding, the mapped data of each file is then
+        # copied once into the group array so that the result is writable and
+        # does not keep the files open
+        first = read_file(files[0])
+        arr = np.empty((len(files), *first.shape), dtype=first.dtype.newbyteorder("="))
+        arr[0] = first
+
+        def copy_file(i: int) -> None:
+            arr[i] = read_file(files[i])
+
+        if ioworkers > 1 and len(files) > 1:
+            with ThreadPoolExecutor(max_workers=ioworkers) as executor:
+                list(executor.map(copy_file, range(1, len(files))))
+        else:
+            for i in range(1, len(files)):
+                copy_file(i)
+
+        return arr
+
+    @staticmethod
+    def _load_and_arrange(
+        files: List[str],
+        use_memmap: bool,
+        reshape_sizes: Tuple[int, ...],
+        axes_order: Tuple[int, ...],
+        shape: Tuple[int, ...],
+        dims_axes: Tuple[int, ...],
+        ioworkers: int,
+    ) -> np.ndarray:
+        arr = TiffGlobReader._arrange_axes(
+            TiffGlobReader._read_files(files, use_memmap, ioworkers),
+            reshape_sizes,
+            axes_order,
+            shape,
+        )
+
+        # Then move the dimensions into the reader dimension order
+        if dims_axes != tuple(range(len(dims_axes))):
+            arr = arr.transpose(dims_axes)
+
+        return arr
+
+    @staticmethod
+    def _arrange_axes(
+        arr: _ArrayT,
+        reshape_sizes: Tuple[int, ...],
+        axes_order: Tuple[int, ...],
+        shape: Tuple[int, ...],
+    ) -> _ArrayT:
+        # unpack the first dimension if it contains multiple axes
+        if arr.shape != reshape_sizes:
+            arr = arr.reshape(reshape_sizes)
+
+        # Then reorder dimensions so matching ones from the glob
+        # and the file are adjacent (glob then file)
+        if axes_order != tuple(range(len(axes_order))):
+            arr = arr.transpose(axes_order)
+
+        # Then reshape the array to the requested shape
+        if arr.shape != shape:
+            arr = arr.reshape(shape)
+
+        return arr
+
+    @staticmethod
+    def _get_native_chunks(tiff: TiffFile) -> Tuple[int, ...]:
+        # Each page is split into strips or tiles along Y and X
+        keyframe = tiff.series[0].keyframe
+        page_chunks = []
+        for axis, size in zip(keyframe.axes, keyframe.shape):
+            if axis == DimensionNames.SpatialY:
+                if keyframe.is_tiled:
+                    size = min(keyframe.tilelength, size)
+                elif keyframe.rowsperstrip > 0:
+                    size = min(keyframe.rowsperstrip, size)
+            elif axis == DimensionNames.SpatialX and keyframe.is_tiled:
+                size = min(keyframe.tilewidth, size)
+            page_chunks.append(size)
+
+        # Dimensions outside of a page are stored one page at a time
+        n_page_dims = len(tiff.series[0].shape) - len(page_chunks)
+        return (1,) * n_page_dims + tuple(page_chunks)
+
     def _get_axes_order(
         self,
-        chunk_sizes: OrderedDict,
-        unpack_sizes: OrderedDict,
-        group_sizes: OrderedDict = OrderedDict(),
-    ) -> Tuple:
-        axes_order: Tuple[int, ...] = ()
+        chunk_sizes: Dict[str, int],
+        unpack_sizes: Dict[str, int],
+    ) -> Tuple[int, ...]:
+        # Axes of the unpacked array are the unpack dims followed by the file dims
+        unpack_dim_index = {d: i for i, d in enumerate(unpack_sizes)}
+        n_unpack_dims = len(unpack_dim_index)
+
+        axes_order: List[int] = []
         for d in chunk_sizes:
-            if d in unpack_sizes:
-                axes_order += (list(unpack_sizes.keys()).index(d),)
-            if d in self._single_file_sizes:
-                axes_order += (
-                    len(unpack_sizes) + list(self._single_file_sizes.keys()).index(d),
-                )
-        return axes_order
+            if d in unpack_dim_index:
+                axes_order.append(unpack_dim_index[d])
+            if d in self._single_file_dim_index:
+                axes_order.append(n_unpack_dims + self._single_file_dim_index[d])
 
-    def _get_chunk_sizes(
-        self, scene_files_nunique: pd.Series, group_dims: List[str] = []
-    ) -> OrderedDict:
-
-        sizes = OrderedDict()
-        for i, x in scene_files_nunique.items():
-            if i not in ["filename", *group_dims]:
-                if i not in self._single_file_dims:
-                    sizes[i] = x
-                else:
-                    sizes[i] = self._single_file_sizes[i] * x
+        return tuple(axes_order)
 
+    def _get_chunk_sizes(
+        self, scene_files_nunique: Dict[str, int], group_dims: List[str] = []
+    ) -> Dict[str, int]:
+        group_dim_set = frozenset(group_dims)
+
+        # Glob dims that are chunked, merged with the matching file dim if present
+        sizes = {
+            d: self._single_file_sizes.get(d, 1) * n
+            for d, n in scene_files_nunique.items()
+            if d not in group_dim_set
+        }
+
+        # Then file dims that are either never chunked or are not in the glob
         for d, s in self._single_file_sizes.items():
-            if d not in self.chunk_dims and d not in sizes:
+            if d not in sizes and (
+                d not in self._chunk_dim_set or d not in scene_files_nunique
+            ):
                 sizes[d] = s
 
-        for i, x in self._single_file_sizes.items():
-            if i not in scene_files_nunique.index:
-                sizes[i] = x
-
         return sizes
 
+    @staticmethod
     def _get_expanded_shapes(
-        self, group_sizes: OrderedDict, chunk_sizes: OrderedDict
-    ) -> Tuple[OrderedDict, OrderedDict]:
-        expanded_blocks_sizes = OrderedDict()
-        expanded_chunk_sizes = OrderedDict()
-
-        for i, (d, s) in enumerate(group_sizes.items()):
-            if d in chunk_sizes:
-                if d not in expanded_blocks_sizes:
-                    d_idx_in_chunks = list(chunk_sizes.keys()).index(d)
-                    for j in range(d_idx_in_chunks):
-                        c_key = list(chunk_sizes.keys())[j]
-                        if c_key not in expanded_blocks_sizes:
-                            expanded_blocks_sizes[c_key] = 1
-
-                    expanded_blocks_sizes[d] = s
-
-            if d not in chunk_sizes:
-                if len(expanded_blocks_sizes) <= i:
-                    expanded_blocks_sizes[d] = s
-                else:
-                    for d2 in expanded_blocks_sizes:
-                        expanded_chunk_sizes[d2] = chunk_sizes[d2]
-                    expanded_chunk_sizes[d] = 1
-                    expanded_blocks_sizes[d] = group_sizes[d]
-                    for d2, s2 in chunk_sizes.items():
-                        if d2 not in expanded_chunk_sizes:
-                            expanded_chunk_sizes[d2] = s2
-
-        for d, s in chunk_sizes.items():
-            if d not in expanded_blocks_sizes:
-                expanded_blocks_sizes[d] = 1
-
-        if len(expanded_chunk_sizes) == 0:
-            expanded_chunk_sizes = chunk_sizes
+        group_sizes: Dict[str, int], chunk_sizes: Dict[str, int]
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        # Walk the group dims in order, a group dim that is also part of each chunk
+        # is placed after the chunk dims that precede it. All remaining chunk dims
+        # follow at the end. Every dim is then present in both the blocks and the
+        # chunks, with a singleton size where it is not grouped or not chunked.
+        chunk_dims = list(chunk_sizes)
+        chunk_dim_index = {d: i for i, d in enumerate(chunk_dims)}
+        dims: List[str] = []
+        n_placed_chunk_dims = 0
+        for d in group_sizes:
+            if d in chunk_dim_index:
+                d_idx_in_chunks = chunk_dim_index[d]
+                for c_key in chunk_dims[n_placed_chunk_dims:d_idx_in_chunks]:
+                    if c_key not in group_sizes:
+                        dims.append(c_key)
+                n_placed_chunk_dims = max(n_placed_chunk_dims, d_idx_in_chunks + 1)
+            dims.append(d)
+
+        dims += [d for d in chunk_dims[n_placed_chunk_dims:] if d not in group_sizes]
+
+        expanded_blocks_sizes = {d: group_sizes.get(d, 1) for d in dims}
+        expanded_chunk_sizes = {d: chunk_sizes.get(d, 1) for d in dims}
 
         return expanded_blocks_sizes, expanded_chunk_sizes
 
@@ -590,18 +1104,17 @@ class TiffGlobReader(Reader):
 
         return coords
 
-    def _get_tiff_tags(self, tiff: TiffFile) -> TiffTags:
+    @staticmethod
+    def _get_tiff_tags(tiff: TiffFile) -> Dict[int, Any]:
         unprocessed_tags = tiff.series[0].pages[0].tags
 
         # Create dict of tag and value
-        tags: Dict[int, str] = {}
-        for code, tag in unprocessed_tags.items():
-            tags[code] = tag.value
-
-        return tags
+        return {tag.code: tag.value for tag in unprocessed_tags.values()}
 
-    @staticmethod
-    def MicroManagerIndexer(path_to_img: Union[str, Path]) -> pd.Series:
+    @VectorizedIndexer
+    def MicroManagerIndexer(
+        path_to_img: Union[str, Path, pd.Series],
+    ) -> Union[pd.Series, pd.DataFrame]:
         """
         An indexer function to transform Micromanager MDA tiff filenames
         to indices. To use::
@@ -611,15 +1124,21 @@ class TiffGlobReader(Reader):
         Expects images to have names of the form:
             img_channel_[0-9]+_position[0-9]+_time[0-9]+_z[0-9]+.tif[f]
 
+        When given a pd.Series of paths all of them are indexed at once and a
+        pd.DataFrame with one row per path is returned.
+
         Parameters
         ----------
-        path_to_img : [str, Path]
+        path_to_img : [str, Path, pd.Series]
             The path to an image.
 
         Returns
         -------
-        pd.Series
+        Union[pd.Series, pd.DataFrame]
         """
-        inds = re.findall(r"\d+", Path(path_to_img).name)
+        if isinstance(path_to_img, pd.Series):
+            return _extract_indices(path_to_img, ["C", "S", "T", "Z"])
+
+        inds = _DIGIT_RE.findall(Path(path_to_img).name)
         series = pd.Series(inds, index=["C", "S", "T", "Z"]).astype(int)
         return series
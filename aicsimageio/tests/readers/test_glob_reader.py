@@ -1,8 +1,11 @@
 #! usr/env/bin/python
+import io
 import os
+import re
 from itertools import product
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -11,7 +14,7 @@ import tifffile as tiff
 import xarray as xr
 
 import aicsimageio
-from aicsimageio.readers.tiff_glob_reader import TiffGlobReader
+from aicsimageio.readers.tiff_glob_reader import TiffGlobReader, VectorizedIndexer
 
 DATA_SHAPE = (3, 4, 5, 6, 7, 8)  # STCZYX
 
@@ -27,7 +30,9 @@ def check_values(
         assert np.all(reference.isel(S=i).data == reader.xarray_data.data)
 
 
-def make_fake_data_2d(path: Path, as_mm: bool = False) -> xr.DataArray:
+def make_fake_data_2d(
+    path: Path, as_mm: bool = False, compression: Optional[str] = None
+) -> xr.DataArray:
     """
     Parameters
     ----------
@@ -35,6 +40,8 @@ def make_fake_data_2d(path: Path, as_mm: bool = False) -> xr.DataArray:
         Folder to save data in
     as_mm : [bool]
         Whether to save the data in with Micromanager MDA naming conventions.
+    compression : [Optional[str]]
+        Compression to save the files with.
 
     Returns
     -------
@@ -58,6 +65,7 @@ def make_fake_data_2d(path: Path, as_mm: bool = False) -> xr.DataArray:
             str(path / "2d_images" / name),
             im,
             dtype=np.uint16,
+            compression=compression,
         )
     return x_data
 
@@ -66,10 +74,120 @@ def test_glob_reader_2d(tmp_path: Path) -> None:
     reference = make_fake_data_2d(tmp_path)
     gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif"))
 
+    # uncompressed files are memory mapped and copied out so that the data does
+    # not hold the files open
+    with patch(
+        "aicsimageio.readers.tiff_glob_reader.memmap", wraps=tiff.memmap
+    ) as mock_memmap:
+        # compute the chunk as returned by the read, dask copies it otherwise
+        block = gr.dask_data.to_delayed().ravel()[0].compute()
+    assert mock_memmap.called
+    assert block.flags.writeable
+
     assert gr.xarray_dask_data.data.chunksize == (1, 1) + DATA_SHAPE[-3:]
 
     check_values(gr, reference)
 
+    # the files of each chunk can be read in parallel
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), maxworkers=2
+    )
+    check_values(gr, reference)
+
+
+def test_glob_reader_2d_compressed(tmp_path: Path) -> None:
+    # compressed files can not be memory mapped and are decoded instead
+    reference = make_fake_data_2d(tmp_path, compression="zlib")
+    gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif"))
+
+    with patch(
+        "aicsimageio.readers.tiff_glob_reader.memmap", wraps=tiff.memmap
+    ) as mock_memmap:
+        # compute the chunk as returned by the read, dask copies it otherwise
+        block = gr.dask_data.to_delayed().ravel()[0].compute()
+    assert not mock_memmap.called
+    assert block.flags.writeable
+
+    assert gr.xarray_dask_data.data.chunksize == (1, 1) + DATA_SHAPE[-3:]
+    check_values(gr, reference)
+
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), maxworkers=2
+    )
+    check_values(gr, reference)
+
+    # one file per chunk
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), chunk_dims="YX"
+    )
+    assert gr.xarray_dask_data.data.chunksize == (1, 1, 1) + DATA_SHAPE[-2:]
+    check_values(gr, reference)
+
+
+def test_glob_reader_chunks(tmp_path: Path) -> None:
+    reference = make_fake_data_2d(tmp_path)
+
+    # chunks are given in the reader dim order, here "TCZYX"
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), chunks={1: -1, 3: 4}
+    )
+    assert gr.xarray_dask_data.data.chunksize == (1, 5, 6, 4, 8)
+    check_values(gr, reference)
+
+    # or by dimension name
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), chunks={"C": -1, "Y": 4}
+    )
+    assert gr.xarray_dask_data.data.chunksize == (1, 5, 6, 4, 8)
+
+    with pytest.raises(ValueError):
+        aicsimageio.readers.TiffGlobReader(
+            str(tmp_path / "2d_images/*.tif"), chunks={"Q": -1}
+        )
+
+    # keys must name a single dimension
+    with pytest.raises(ValueError):
+        aicsimageio.readers.TiffGlobReader(
+            str(tmp_path / "2d_images/*.tif"), chunks={"TC": 1}
+        )
+
+    # native chunks follow the files and the strips each file is stored in
+    os.mkdir(str(tmp_path / "strips"))
+    data = np.arange(3 * 32 * 16, dtype=np.uint16).reshape(3, 32, 16)
+    for z in range(3):
+        tiff.imwrite(
+            str(tmp_path / f"strips/S0_T0_C0_Z{z}.tif"), data[z], rowsperstrip=8
+        )
+
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "strips/*.tif"), chunks="native"
+    )
+    assert gr.xarray_dask_data.data.chunksize == (1, 1, 1, 8, 16)
+    np.testing.assert_array_equal(gr.get_image_data("ZYX"), data)
+    np.testing.assert_array_equal(
+        gr.get_image_dask_data("YX", Z=1, Y=slice(8, 20)).compute(), data[1, 8:20]
+    )
+
+
+def test_scene_tiff_tags(tmp_path: Path) -> None:
+    _ = make_fake_data_2d(tmp_path)
+
+    # a corrupt file in another scene does not prevent reading this one
+    (tmp_path / "2d_images/S2_T0_C0_Z0.tif").write_bytes(b"not a tiff")
+    gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif"))
+    gr.set_scene(1)
+    assert gr.metadata is not None
+
+    # tags whose values are past the prefetched bytes are not silently dropped
+    buffer = io.BytesIO()
+    tiff.imwrite(
+        buffer, np.zeros((8, 8), np.uint16), description="x" * 40000, metadata=None
+    )
+    tags = TiffGlobReader._parse_tiff_tags(buffer.getvalue())
+    assert tags is not None and len(tags[270]) == 40000
+    assert TiffGlobReader._parse_tiff_tags(buffer.getvalue()[:16384]) is None
+    assert TiffGlobReader._parse_tiff_tags(b"not a tiff") is None
+
 
 def test_index_alignment(tmp_path: Path) -> None:
     # Testing case where user has passed in a list of files
@@ -96,6 +214,45 @@ def test_index_alignment(tmp_path: Path) -> None:
     assert not reader._all_files.isnull().any().any()
 
 
+def test_non_contiguous_indices(tmp_path: Path) -> None:
+    # indices only need to be ordered, not to start at zero or be contiguous
+    reference = make_fake_data_2d(tmp_path)
+    os.mkdir(str(tmp_path / "shifted"))
+    for f in (tmp_path / "2d_images").glob("*.tif"):
+        s, t, c, z = map(int, re.findall(r"\d+", f.name))
+        f.rename(tmp_path / f"shifted/S{s}_T{2 * t + 1}_C{c}_Z{z}.tif")
+
+    gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "shifted/*.tif"))
+    check_values(gr, reference)
+
+
+def test_large_indices(tmp_path: Path) -> None:
+    # timestamp style indices do not fit in 32 bits
+    os.mkdir(str(tmp_path / "timestamps"))
+    times = [2**32, 20230115120000, 20230115120001]
+    data = np.arange(len(times) * 7 * 8, dtype=np.uint16).reshape(len(times), 7, 8)
+    for t, im in zip(times, data):
+        tiff.imwrite(str(tmp_path / f"timestamps/S0_T{t}_C0_Z0.tif"), im)
+
+    gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "timestamps/*.tif"))
+    assert gr.dims.T == len(times)
+    np.testing.assert_array_equal(gr.get_image_dask_data("TYX").compute(), data)
+    np.testing.assert_array_equal(gr.get_image_data("TYX"), data)
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    _ = make_fake_data_2d(tmp_path)
+    os.remove(str(tmp_path / "2d_images/S0_T1_C2_Z3.tif"))
+
+    # incomplete groups are rejected when the array is built, not on compute
+    gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif"))
+    with pytest.raises(ValueError):
+        gr.dask_data
+
+    with pytest.raises(ValueError):
+        gr.data
+
+
 @pytest.mark.parametrize(
     "type_",
     [
@@ -115,12 +272,37 @@ def test_glob_types(type_: Any, tmp_path: Path) -> None:
 
 
 def test_mm_indexer(tmp_path: Path) -> None:
-    _ = make_fake_data_2d(tmp_path, True)
+    reference = make_fake_data_2d(tmp_path, True)
     gr = aicsimageio.readers.TiffGlobReader(
         str(tmp_path / "2d_images/*.tif"), indexer=TiffGlobReader.MicroManagerIndexer
     )
     assert gr.dims.order == "TCZYX"
     assert gr.dims.shape == DATA_SHAPE[1:]
+    check_values(gr, reference)
+
+
+def test_vectorized_indexer(tmp_path: Path) -> None:
+    _ = make_fake_data_2d(tmp_path, as_mm=True)
+    filenames = pd.Series(list((tmp_path / "2d_images").glob("*.tif")))
+
+    # indexing the full series must match indexing each file individually
+    expected = filenames.apply(TiffGlobReader.MicroManagerIndexer)
+    indices = TiffGlobReader.MicroManagerIndexer(filenames)
+    assert (indices.values == expected.values).all()
+    assert list(indices.columns) == list(expected.columns)
+
+    # custom indexers can also index the full series at once
+    @VectorizedIndexer
+    def mm_indexer(paths: pd.Series) -> pd.DataFrame:
+        return paths.apply(TiffGlobReader.MicroManagerIndexer)
+
+    gr = TiffGlobReader(filenames, indexer=mm_indexer)
+    assert gr.dims.order == "TCZYX"
+    assert gr.dims.shape == DATA_SHAPE[1:]
+
+    # filenames without the expected number of indices are rejected
+    with pytest.raises(ValueError):
+        TiffGlobReader(filenames.map(lambda p: p.with_name("no_indices.tif")))
 
 
 def make_fake_data_3d(path: Path) -> xr.DataArray:
@@ -240,6 +422,33 @@ def test_glob_reader_4d(tmp_path: Path) -> None:
     check_values(gr, reference)
 
 
+def test_glob_reader_interleaved_group_dims(tmp_path: Path) -> None:
+    # T is both grouped across files and stored within each file, with C and Z
+    # grouped in between
+    data = np.arange(np.prod(DATA_SHAPE), dtype="uint16").reshape(DATA_SHAPE)
+    reference = xr.DataArray(data, dims=list("STCZYX"))
+
+    os.mkdir(str(tmp_path / "tyx_images"))
+    per_file_t = 2
+    t_files = int(DATA_SHAPE[1] / per_file_t)
+    for s, t, c, z in product(
+        *(range(x) for x in (DATA_SHAPE[0], t_files, *DATA_SHAPE[2:4]))
+    ):
+        tiff.imwrite(
+            str(tmp_path / f"tyx_images/S{s}_T{t}_C{c}_Z{z}.tif"),
+            data[s, per_file_t * t : per_file_t * (t + 1), c, z],
+            photometric="MINISBLACK",
+        )
+
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "tyx_images/*.tif"),
+        single_file_dims=list("TYX"),
+        chunk_dims=list("YX"),
+    )
+    assert gr.xarray_dask_data.data.chunksize == (2, 1, 1, 7, 8)
+    check_values(gr, reference)
+
+
 def test_aics_image(tmp_path: Path) -> None:
 
     _ = make_fake_data_4d(tmp_path)